@@ -23,6 +23,8 @@
 
 # wait at most 24 hours by default for run execution
 DEFAULT_RUN_MAX_WAIT_TIME_SEC: Final = 24 * 60 * 60
+DEFAULT_MAX_POLL_INTERVAL_SEC: Final = 60
+DEFAULT_POLL_BACKOFF_FACTOR: Final = 2
 
 
 class DatabricksError(Exception):
@@ -277,10 +279,32 @@ def wait_for_run_to_complete(
         poll_interval_sec: float,
         max_wait_time_sec: int,
         verbose_logs: bool = True,
+        max_poll_interval_sec: float = DEFAULT_MAX_POLL_INTERVAL_SEC,
+        poll_backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
     ) -> None:
+        """Block until the run terminates, polling with capped exponential backoff.
+
+        The first wait is `poll_interval_sec`, and each subsequent wait is multiplied by
+        `poll_backoff_factor` up to `max_poll_interval_sec` (or `poll_interval_sec`, if larger).
+        Set `poll_backoff_factor` to 1 to poll at a fixed interval. Waits never extend past
+        `max_wait_time_sec`.
+        """
+        check.numeric_param(poll_interval_sec, "poll_interval_sec")
+        check.numeric_param(max_poll_interval_sec, "max_poll_interval_sec")
+        check.numeric_param(poll_backoff_factor, "poll_backoff_factor")
+        check.param_invariant(poll_interval_sec > 0, "poll_interval_sec", "Must be greater than 0.")
+        check.param_invariant(
+            max_poll_interval_sec > 0, "max_poll_interval_sec", "Must be greater than 0."
+        )
+        check.param_invariant(
+            poll_backoff_factor >= 1, "poll_backoff_factor", "Must be greater than or equal to 1."
+        )
+
         logger.info(f"Waiting for Databricks run `{databricks_run_id}` to complete...")
 
         start_poll_time = time.time()
+        max_interval = max(poll_interval_sec, max_poll_interval_sec)
+        next_wait = poll_interval_sec
         while True:
             if self.poll_run_state(
                 logger=logger,
@@ -291,7 +315,9 @@ def wait_for_run_to_complete(
             ):
                 return
 
-            time.sleep(poll_interval_sec)
+            remaining_sec = start_poll_time + max_wait_time_sec - time.time()
+            time.sleep(min(next_wait, max(0, remaining_sec)))
+            next_wait = min(max_interval, next_wait * poll_backoff_factor)
 
 
 class DatabricksJobRunner:
@@ -12,6 +12,7 @@
 from pydantic import Field
 
 DEFAULT_POLL_INTERVAL_SECONDS = 10
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 60
 # wait at most 24 hours by default for run execution
 DEFAULT_MAX_WAIT_TIME_SECONDS = 24 * 60 * 60
 from dagster import Config
@@ -27,6 +28,7 @@ def create_databricks_run_now_op(
     max_wait_time_seconds: float = DEFAULT_MAX_WAIT_TIME_SECONDS,
     name: Optional[str] = None,
     databricks_resource_key: str = "databricks",
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
 ) -> OpDefinition:
     """Creates an op that launches an existing databricks job.
 
@@ -40,14 +42,17 @@ def create_databricks_run_now_op(
         databricks_job_configuration (dict): Configuration for triggering a new job run of a
             Databricks Job. See https://docs.databricks.com/api-explorer/workspace/jobs/runnow
             for the full configuration.
-        poll_interval_seconds (float): How often to poll the Databricks API to check whether the
-            Databricks job has finished running.
+        poll_interval_seconds (float): How long to wait before first polling the Databricks API
+            to check whether the Databricks job has finished running. The wait doubles after
+            each poll, up to ``max_poll_interval_seconds``.
         max_wait_time_seconds (float): How long to wait for the Databricks job to finish running
             before raising an error.
         name (Optional[str]): The name of the op. If not provided, the name will be
             _databricks_run_now_op.
         databricks_resource_key (str): The name of the resource key used by this op. If not
             provided, the resource key will be "databricks".
+        max_poll_interval_seconds (float): The longest wait between polls of the Databricks API.
+            Set this equal to ``poll_interval_seconds`` to poll at a fixed interval.
 
     Returns:
         OpDefinition: An op definition to run the Databricks Job.
@@ -86,11 +91,22 @@ def do_stuff():
     """
     _poll_interval_seconds = poll_interval_seconds
     _max_wait_time_seconds = max_wait_time_seconds
+    _max_poll_interval_seconds = max_poll_interval_seconds
 
     class DatabricksRunNowOpConfig(Config):
         poll_interval_seconds: float = Field(
             default=_poll_interval_seconds,
-            description="Check whether the Databricks Job is done at this interval, in seconds.",
+            description=(
+                "Initial interval, in seconds, at which to check whether the Databricks Job is"
+                " done. The interval doubles after each check, up to max_poll_interval_seconds."
+            ),
+        )
+        max_poll_interval_seconds: float = Field(
+            default=_max_poll_interval_seconds,
+            description=(
+                "Maximum interval, in seconds, between checks of whether the Databricks Job is"
+                " done. Set equal to poll_interval_seconds to check at a fixed interval."
+            ),
         )
         max_wait_time_seconds: int = Field(
             default=_max_wait_time_seconds,
@@ -128,6 +144,7 @@ def _databricks_run_now_op(context: OpExecutionContext, config: DatabricksRunNow
             databricks_run_id=run_id,
             poll_interval_sec=config.poll_interval_seconds,
             max_wait_time_sec=config.max_wait_time_seconds,
+            max_poll_interval_sec=config.max_poll_interval_seconds,
         )
 
     return _databricks_run_now_op
@@ -139,6 +156,7 @@ def create_databricks_submit_run_op(
     max_wait_time_seconds: float = DEFAULT_MAX_WAIT_TIME_SECONDS,
     name: Optional[str] = None,
     databricks_resource_key: str = "databricks",
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
 ) -> OpDefinition:
     """Creates an op that submits a one-time run of a set of tasks on Databricks.
 
@@ -149,14 +167,17 @@ def create_databricks_submit_run_op(
         databricks_job_configuration (dict): Configuration for submitting a one-time run of a set
             of tasks on Databricks. See https://docs.databricks.com/api-explorer/workspace/jobs/submit
             for the full configuration.
-        poll_interval_seconds (float): How often to poll the Databricks API to check whether the
-            Databricks job has finished running.
+        poll_interval_seconds (float): How long to wait before first polling the Databricks API
+            to check whether the Databricks job has finished running. The wait doubles after
+            each poll, up to ``max_poll_interval_seconds``.
         max_wait_time_seconds (float): How long to wait for the Databricks job to finish running
             before raising an error.
         name (Optional[str]): The name of the op. If not provided, the name will be
             _databricks_submit_run_op.
         databricks_resource_key (str): The name of the resource key used by this op. If not
             provided, the resource key will be "databricks".
+        max_poll_interval_seconds (float): The longest wait between polls of the Databricks API.
+            Set this equal to ``poll_interval_seconds`` to poll at a fixed interval.
 
     Returns:
         OpDefinition: An op definition to submit a one-time run of a set of tasks on Databricks.
@@ -198,11 +219,22 @@ def do_stuff():
 
     _poll_interval_seconds = poll_interval_seconds
     _max_wait_time_seconds = max_wait_time_seconds
+    _max_poll_interval_seconds = max_poll_interval_seconds
 
     class DatabricksSubmitRunOpConfig(Config):
         poll_interval_seconds: float = Field(
             default=_poll_interval_seconds,
-            description="Check whether the Databricks Job is done at this interval, in seconds.",
+            description=(
+                "Initial interval, in seconds, at which to check whether the Databricks Job is"
+                " done. The interval doubles after each check, up to max_poll_interval_seconds."
+            ),
+        )
+        max_poll_interval_seconds: float = Field(
+            default=_max_poll_interval_seconds,
+            description=(
+                "Maximum interval, in seconds, between checks of whether the Databricks Job is"
+                " done. Set equal to poll_interval_seconds to check at a fixed interval."
+            ),
         )
         max_wait_time_seconds: int = Field(
             default=_max_wait_time_seconds,
@@ -241,6 +273,7 @@ def _databricks_submit_run_op(
             databricks_run_id=run_id,
             poll_interval_sec=config.poll_interval_seconds,
             max_wait_time_sec=config.max_wait_time_seconds,
+            max_poll_interval_sec=config.max_poll_interval_seconds,
         )
 
     return _databricks_submit_run_op
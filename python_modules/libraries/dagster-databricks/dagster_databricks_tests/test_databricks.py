@@ -1,6 +1,10 @@
+import itertools
+from contextlib import nullcontext
+from typing import Any, List, Mapping, NamedTuple
 from unittest import mock
 
 import dagster
+import dagster._check as check
 import dagster_databricks
 import dagster_pyspark
 import pytest
@@ -16,9 +20,63 @@
 HOST = "https://uksouth.azuredatabricks.net"
 TOKEN = "super-secret-token"
 
+_DEFAULT_LIBRARIES = [
+    compute.Library(pypi=compute.PythonPyPiLibrary(package=f"dagster=={dagster.__version__}")),
+    compute.Library(
+        pypi=compute.PythonPyPiLibrary(
+            package=f"dagster-databricks=={dagster_databricks.__version__}"
+        )
+    ),
+    compute.Library(
+        pypi=compute.PythonPyPiLibrary(package=f"dagster-pyspark=={dagster_pyspark.__version__}")
+    ),
+]
+
+
+_PENDING_RUN = jobs.Run(
+    state=jobs.RunState(
+        life_cycle_state=DatabricksRunLifeCycleState.PENDING,
+        state_message="",
+    ),
+)
+_RUNNING_RUN = jobs.Run(
+    state=jobs.RunState(
+        life_cycle_state=DatabricksRunLifeCycleState.RUNNING,
+        state_message="",
+    ),
+)
+_SUCCESS_RUN = jobs.Run(
+    state=jobs.RunState(
+        result_state=DatabricksRunResultState.SUCCESS,
+        life_cycle_state=DatabricksRunLifeCycleState.TERMINATED,
+        state_message="Finished",
+    ),
+)
+
+class _ExpectedRunSettings(NamedTuple):
+    email_notifications: jobs.JobEmailNotifications
+    notification_settings: jobs.JobNotificationSettings
+    webhook_notifications: jobs.WebhookNotifications
+    job_health_settings: List[jobs.JobsHealthRule]
+
+
+def _expected_health(config: Mapping[str, Any]) -> List[jobs.JobsHealthRule]:
+    return [jobs.JobsHealthRule.from_dict(h) for h in config["job_health_settings"]]
+
 
-@mock.patch("databricks.sdk.JobsAPI.submit")
-def test_databricks_submit_job_existing_cluster(mock_submit_run, databricks_run_config):
+def _build_expected_run_settings(config: Mapping[str, Any]) -> _ExpectedRunSettings:
+    return _ExpectedRunSettings(
+        email_notifications=jobs.JobEmailNotifications.from_dict(config["email_notifications"]),
+        notification_settings=jobs.JobNotificationSettings.from_dict(
+            config["notification_settings"]
+        ),
+        webhook_notifications=jobs.WebhookNotifications.from_dict(config["webhook_notifications"]),
+        job_health_settings=_expected_health(config),
+    )
+
+
+def test_databricks_submit_job_existing_cluster(mocker: MockerFixture, databricks_run_config):
+    mock_submit_run = mocker.patch("databricks.sdk.JobsAPI.submit")
     mock_submit_run_response = mock.Mock()
     mock_submit_run_response.bind.return_value = {"run_id": 1}
     mock_submit_run.return_value = mock_submit_run_response
@@ -28,30 +86,19 @@ def test_databricks_submit_job_existing_cluster(mock_submit_run, databricks_run_
     expected_task = jobs.SubmitTask.from_dict(task)
     expected_task.existing_cluster_id = databricks_run_config["cluster"]["existing"]
     expected_task.task_key = "dagster-task"
-    expected_task.libraries = [
-        compute.Library(pypi=compute.PythonPyPiLibrary(package=f"dagster=={dagster.__version__}")),
-        compute.Library(
-            pypi=compute.PythonPyPiLibrary(
-                package=f"dagster-databricks=={dagster_databricks.__version__}"
-            )
-        ),
-        compute.Library(
-            pypi=compute.PythonPyPiLibrary(
-                package=f"dagster-pyspark=={dagster_pyspark.__version__}"
-            )
-        ),
-    ]
-    expected_health = [
-        jobs.JobsHealthRule.from_dict(h) for h in databricks_run_config["job_health_settings"]
-    ]
+    expected_task.libraries = list(_DEFAULT_LIBRARIES)
+    expected_health = _expected_health(databricks_run_config)
+    run_name = databricks_run_config["run_name"]
+    idempotency_token = databricks_run_config["idempotency_token"]
+    timeout_seconds = databricks_run_config["timeout_seconds"]
 
     runner.submit_run(databricks_run_config, task)
     mock_submit_run.assert_called_with(
-        run_name=databricks_run_config["run_name"],
+        run_name=run_name,
         tasks=[expected_task],
         health=expected_health,
-        idempotency_token=databricks_run_config["idempotency_token"],
-        timeout_seconds=databricks_run_config["timeout_seconds"],
+        idempotency_token=idempotency_token,
+        timeout_seconds=timeout_seconds,
     )
 
     databricks_run_config["install_default_libraries"] = False
@@ -59,16 +106,16 @@ def test_databricks_submit_job_existing_cluster(mock_submit_run, databricks_run_
 
     runner.submit_run(databricks_run_config, task)
     mock_submit_run.assert_called_with(
-        run_name=databricks_run_config["run_name"],
+        run_name=run_name,
         tasks=[expected_task],
         health=expected_health,
-        idempotency_token=databricks_run_config["idempotency_token"],
-        timeout_seconds=databricks_run_config["timeout_seconds"],
+        idempotency_token=idempotency_token,
+        timeout_seconds=timeout_seconds,
     )
 
 
-@mock.patch("databricks.sdk.JobsAPI.submit")
-def test_databricks_submit_job_new_cluster(mock_submit_run, databricks_run_config):
+def test_databricks_submit_job_new_cluster(mocker: MockerFixture, databricks_run_config):
+    mock_submit_run = mocker.patch("databricks.sdk.JobsAPI.submit")
     mock_submit_run_response = mock.Mock()
     mock_submit_run_response.bind.return_value = {"run_id": 1}
     mock_submit_run.return_value = mock_submit_run_response
@@ -122,138 +169,180 @@ def test_databricks_submit_job_new_cluster(mock_submit_run, databricks_run_confi
         num_workers=NEW_CLUSTER["size"]["num_workers"],
         custom_tags={"__dagster_version": dagster.__version__},
     )
-    expected_task.libraries = [
-        compute.Library(pypi=compute.PythonPyPiLibrary(package=f"dagster=={dagster.__version__}")),
-        compute.Library(
-            pypi=compute.PythonPyPiLibrary(
-                package=f"dagster-databricks=={dagster_databricks.__version__}"
-            )
-        ),
-        compute.Library(
-            pypi=compute.PythonPyPiLibrary(
-                package=f"dagster-pyspark=={dagster_pyspark.__version__}"
-            )
-        ),
-    ]
+    expected_task.libraries = list(_DEFAULT_LIBRARIES)
 
-    expected_email_notifications = jobs.JobEmailNotifications.from_dict(
-        databricks_run_config["email_notifications"]
-    )
-    expected_notification_settings = jobs.JobNotificationSettings.from_dict(
-        databricks_run_config["notification_settings"]
-    )
-    expected_webhook_notifications = jobs.WebhookNotifications.from_dict(
-        databricks_run_config["webhook_notifications"]
-    )
-    expected_job_health_settings = [
-        jobs.JobsHealthRule.from_dict(j) for j in databricks_run_config["job_health_settings"]
-    ]
+    expected = _build_expected_run_settings(databricks_run_config)
+    run_name = databricks_run_config["run_name"]
+    idempotency_token = databricks_run_config["idempotency_token"]
+    timeout_seconds = databricks_run_config["timeout_seconds"]
     runner.submit_run(databricks_run_config, task)
     mock_submit_run.assert_called_once_with(
-        run_name=databricks_run_config["run_name"],
+        run_name=run_name,
         tasks=[expected_task],
-        health=expected_job_health_settings,
-        email_notifications=expected_email_notifications,
-        notification_settings=expected_notification_settings,
-        webhook_notifications=expected_webhook_notifications,
-        idempotency_token=databricks_run_config["idempotency_token"],
-        timeout_seconds=databricks_run_config["timeout_seconds"],
+        health=expected.job_health_settings,
+        email_notifications=expected.email_notifications,
+        notification_settings=expected.notification_settings,
+        webhook_notifications=expected.webhook_notifications,
+        idempotency_token=idempotency_token,
+        timeout_seconds=timeout_seconds,
     )
 
 
-def test_databricks_wait_for_run(mocker: MockerFixture):
-    context = build_op_context()
-    mock_submit_run = mocker.patch("databricks.sdk.JobsAPI.submit")
-    mock_get_run = mocker.patch("databricks.sdk.JobsAPI.get_run")
+@pytest.fixture(scope="session")
+def databricks_client() -> DatabricksClient:
+    return DatabricksClient(host=HOST, token=TOKEN)
 
-    mock_submit_run_response = mock.Mock()
-    mock_submit_run_response.bind.return_value = {"run_id": 1}
-    mock_submit_run.return_value = mock_submit_run_response
 
-    databricks_client = DatabricksClient(host=HOST, token=TOKEN)
+@pytest.fixture(scope="module")
+def op_logger():
+    return build_op_context().log
 
-    calls = {
-        "num_calls": 0,
-        "final_state": jobs.Run(
-            state=jobs.RunState(
-                result_state=DatabricksRunResultState.SUCCESS,
-                life_cycle_state=DatabricksRunLifeCycleState.TERMINATED,
-                state_message="Finished",
-            ),
-        ),
-    }
 
-    def _get_run(*args, **kwargs) -> dict:
-        calls["num_calls"] += 1
+@pytest.fixture
+def wait_for_run_setup(mocker: MockerFixture, databricks_client: DatabricksClient):
+    mock_get_run = mocker.patch("databricks.sdk.JobsAPI.get_run")
+    mock_sleep = mocker.patch("dagster_databricks.databricks.time.sleep", return_value=None)
+    return databricks_client, mock_get_run, mock_sleep
+
 
-        if calls["num_calls"] == 1:
-            return jobs.Run(
+@pytest.mark.parametrize(
+    "final_state,expect_raises,expected_msg",
+    [
+        pytest.param(_SUCCESS_RUN, nullcontext(), None, id="success"),
+        pytest.param(
+            jobs.Run(
                 state=jobs.RunState(
-                    life_cycle_state=DatabricksRunLifeCycleState.PENDING,
-                    state_message="",
+                    result_state=None,
+                    life_cycle_state=DatabricksRunLifeCycleState.SKIPPED,
+                    state_message="Skipped",
                 ),
-            )
-        elif calls["num_calls"] == 2:
-            return jobs.Run(
+            ),
+            nullcontext(),
+            None,
+            id="skipped",
+        ),
+        pytest.param(
+            jobs.Run(
                 state=jobs.RunState(
-                    life_cycle_state=DatabricksRunLifeCycleState.RUNNING,
-                    state_message="",
+                    result_state=DatabricksRunResultState.FAILED,
+                    life_cycle_state=DatabricksRunLifeCycleState.TERMINATED,
+                    state_message="Failed",
                 ),
-            )
-        else:
-            return calls["final_state"]
+            ),
+            pytest.raises(DatabricksError),
+            "Run `1` failed with result state",
+            id="failed",
+        ),
+    ],
+)
+def test_databricks_wait_for_run(
+    wait_for_run_setup, op_logger, final_state, expect_raises, expected_msg
+):
+    databricks_client, mock_get_run, _ = wait_for_run_setup
+    mock_get_run.side_effect = itertools.chain(
+        [_PENDING_RUN, _RUNNING_RUN], itertools.repeat(final_state)
+    )
 
-    mock_get_run.side_effect = _get_run
+    with expect_raises as exc_info:
+        databricks_client.wait_for_run_to_complete(
+            logger=op_logger,
+            databricks_run_id=1,
+            poll_interval_sec=1,
+            max_wait_time_sec=10,
+            verbose_logs=True,
+        )
 
-    databricks_client.wait_for_run_to_complete(
-        logger=context.log,
-        databricks_run_id=1,
-        poll_interval_sec=0.01,
-        max_wait_time_sec=10,
-        verbose_logs=True,
-    )
+    if expected_msg:
+        assert expected_msg in str(exc_info.value)
 
-    calls["num_calls"] = 0
-    calls["final_state"] = jobs.Run(
-        state=jobs.RunState(
-            result_state=None,
-            life_cycle_state=DatabricksRunLifeCycleState.SKIPPED,
-            state_message="Skipped",
-        ),
-    )
+
+@pytest.mark.parametrize(
+    "poll_interval_sec,max_poll_interval_sec,poll_backoff_factor,expected_sleeps",
+    [
+        pytest.param(2, 60, 2, [2, 4, 8, 16, 32, 60, 60, 60], id="exponential"),
+        pytest.param(90, 60, 2, [90] * 8, id="interval_above_max"),
+        pytest.param(5, 60, 1, [5] * 8, id="fixed_interval"),
+    ],
+)
+def test_databricks_wait_for_run_backoff(
+    wait_for_run_setup,
+    op_logger,
+    poll_interval_sec,
+    max_poll_interval_sec,
+    poll_backoff_factor,
+    expected_sleeps,
+):
+    databricks_client, mock_get_run, mock_sleep = wait_for_run_setup
+    mock_get_run.side_effect = [_PENDING_RUN] * 8 + [_SUCCESS_RUN]
 
     databricks_client.wait_for_run_to_complete(
-        logger=context.log,
+        logger=op_logger,
         databricks_run_id=1,
-        poll_interval_sec=0.01,
-        max_wait_time_sec=10,
+        poll_interval_sec=poll_interval_sec,
+        max_wait_time_sec=3600,
         verbose_logs=True,
+        max_poll_interval_sec=max_poll_interval_sec,
+        poll_backoff_factor=poll_backoff_factor,
     )
 
-    calls["num_calls"] = 0
-    calls["final_state"] = jobs.Run(
-        state=jobs.RunState(
-            result_state=DatabricksRunResultState.FAILED,
-            life_cycle_state=DatabricksRunLifeCycleState.TERMINATED,
-            state_message="Failed",
-        ),
-    )
+    assert [c.args[0] for c in mock_sleep.call_args_list] == expected_sleeps
+
+
+def test_databricks_wait_for_run_backoff_respects_max_wait_time(
+    mocker: MockerFixture, wait_for_run_setup, op_logger
+):
+    databricks_client, mock_get_run, mock_sleep = wait_for_run_setup
+    mock_get_run.return_value = _PENDING_RUN
+
+    clock = {"now": 1000.0}
+
+    def _sleep(seconds: float) -> None:
+        # Each poll takes a little wall time on top of the sleep itself.
+        clock["now"] += seconds + 0.001
 
-    with pytest.raises(DatabricksError) as exc_info:
+    mocker.patch("dagster_databricks.databricks.time.time", side_effect=lambda: clock["now"])
+    mock_sleep.side_effect = _sleep
+
+    with pytest.raises(DatabricksError, match="took more than 100s"):
         databricks_client.wait_for_run_to_complete(
-            logger=context.log,
+            logger=op_logger,
             databricks_run_id=1,
-            poll_interval_sec=0.01,
-            max_wait_time_sec=10,
+            poll_interval_sec=2,
+            max_wait_time_sec=100,
             verbose_logs=True,
+            max_poll_interval_sec=60,
         )
 
-    assert "Run `1` failed with result state" in str(exc_info.value)
+    sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+    assert sleeps[:5] == [2, 4, 8, 16, 32]
+    # The next backoff step would be 60s, but only ~38s remain before the deadline.
+    assert sleeps[5] == pytest.approx(38 - 0.005)
+    assert len(sleeps) == 6
 
 
-def test_dagster_databricks_user_agent() -> None:
-    databricks_client = DatabricksClient(host=HOST, token=TOKEN)
+@pytest.mark.parametrize(
+    "poll_interval_sec,max_poll_interval_sec,poll_backoff_factor",
+    [(1, 60, 0), (1, 60, 0.5), (1, 0, 2), (0, 60, 2), (-1, 60, 2)],
+)
+def test_databricks_wait_for_run_invalid_backoff(
+    databricks_client: DatabricksClient,
+    op_logger,
+    poll_interval_sec,
+    max_poll_interval_sec,
+    poll_backoff_factor,
+):
+    with pytest.raises(check.CheckError):
+        databricks_client.wait_for_run_to_complete(
+            logger=op_logger,
+            databricks_run_id=1,
+            poll_interval_sec=poll_interval_sec,
+            max_wait_time_sec=10,
+            max_poll_interval_sec=max_poll_interval_sec,
+            poll_backoff_factor=poll_backoff_factor,
+        )
+
 
+def test_dagster_databricks_user_agent(databricks_client: DatabricksClient) -> None:
     # TODO: Remove this once databricks_cli is removed
     assert "dagster-databricks" in databricks_client.api_client.default_headers["user-agent"]
 
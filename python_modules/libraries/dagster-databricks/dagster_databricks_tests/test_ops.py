@@ -190,6 +190,86 @@ def test_databricks_job() -> None:
     assert mock_get_run.call_count == 4
 
 
+def _mock_get_run_backoff_response() -> Sequence[jobs.Run]:
+    launched_run, pending_run, _, final_run = _mock_get_run_response()
+    return [launched_run, pending_run, pending_run, pending_run, final_run]
+
+
+def test_databricks_run_now_op_max_poll_interval(mocker: MockerFixture) -> None:
+    mock_run_now = mocker.patch("databricks.sdk.JobsAPI.run_now")
+    mock_get_run = mocker.patch("databricks.sdk.JobsAPI.get_run")
+    mock_sleep = mocker.patch("dagster_databricks.databricks.time.sleep", return_value=None)
+
+    mock_run_now_response = mocker.Mock()
+    mock_run_now_response.bind.return_value = {"run_id": 1}
+    mock_run_now.return_value = mock_run_now_response
+    mock_get_run.side_effect = _mock_get_run_backoff_response()
+
+    test_databricks_run_now_op = create_databricks_run_now_op(
+        databricks_job_id=10,
+        poll_interval_seconds=1,
+        max_poll_interval_seconds=2,
+    )
+
+    @job(
+        resource_defs={
+            "databricks": DatabricksClientResource(
+                host="https://abc123.cloud.databricks.com/", token="token"
+            )
+        }
+    )
+    def test_databricks_job() -> None:
+        test_databricks_run_now_op()
+
+    result = test_databricks_job.execute_in_process()
+
+    assert result.success
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 2]
+
+
+def test_databricks_submit_run_op_max_poll_interval(mocker: MockerFixture) -> None:
+    mock_submit_run = mocker.patch("databricks.sdk.JobsAPI.submit")
+    mock_get_run = mocker.patch("databricks.sdk.JobsAPI.get_run")
+    mock_sleep = mocker.patch("dagster_databricks.databricks.time.sleep", return_value=None)
+
+    mock_submit_run_response = mocker.Mock()
+    mock_submit_run_response.bind.return_value = {"run_id": 1}
+    mock_submit_run.return_value = mock_submit_run_response
+    mock_get_run.side_effect = _mock_get_run_backoff_response()
+
+    test_databricks_submit_run_op = create_databricks_submit_run_op(
+        databricks_job_configuration={
+            "new_cluster": {
+                "spark_version": "2.1.0-db3-scala2.11",
+                "num_workers": 2,
+            },
+            "notebook_task": {
+                "notebook_path": "/Users/dagster@example.com/PrepareData",
+            },
+        },
+        poll_interval_seconds=1,
+    )
+
+    @job(
+        resource_defs={
+            "databricks": DatabricksClientResource(
+                host="https://abc123.cloud.databricks.com/", token="token"
+            )
+        }
+    )
+    def test_databricks_job() -> None:
+        test_databricks_submit_run_op()
+
+    result = test_databricks_job.execute_in_process(
+        run_config={
+            "ops": {"_databricks_submit_run_op": {"config": {"max_poll_interval_seconds": 2}}}
+        }
+    )
+
+    assert result.success
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 2]
+
+
 def test_databricks_submit_run_op_no_job() -> None:
     with pytest.raises(CheckError):
         create_databricks_submit_run_op(databricks_job_configuration={})